@@ -1,10 +1,56 @@
 """Periodic Quiz - Learn the periodic table through interactive quizzes."""
 
+import argparse
+
 from .game import PeriodicQuiz
 
 
-def main():
+def _int_at_least(value: str, minimum: int) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < minimum:
+        raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {number}")
+    return number
+
+
+def positive_int(value: str) -> int:
+    """Parse a command-line value that must be a positive integer."""
+    return _int_at_least(value, 1)
+
+
+def non_negative_int(value: str) -> int:
+    """Parse a command-line value that must be zero or a positive integer."""
+    return _int_at_least(value, 0)
+
+
+def main(argv=None):
     """Main entry point for the CLI game."""
+    parser = argparse.ArgumentParser(prog="periodic-quiz", description="Learn the periodic table.")
+    parser.add_argument("--profile", nargs="?", const="periodic_quiz_profile", metavar="PREFIX",
+                        help="profile the session, writing PREFIX.pstats and PREFIX.collapsed")
+    parser.add_argument("--simulate", type=positive_int, metavar="ROUNDS",
+                        help="play ROUNDS rounds with a simulated student instead of the menu")
+    args = parser.parse_args(argv)
+
+    if args.simulate is not None:
+        from .simulate import print_report, simulate
+
+        def session():
+            print_report(simulate(rounds=args.simulate, workers=1))
+    else:
+        session = play
+
+    if args.profile:
+        from .profiling import run_profiled
+        run_profiled(session, args.profile)
+    else:
+        session()
+
+
+def play():
+    """Run the interactive menu."""
     quiz = PeriodicQuiz()
 
     print("\n" + "=" * 50)
@@ -0,0 +1,148 @@
+"""Append-only checkpoint log for resuming an interrupted quiz round.
+
+Each record is a compact binary snapshot of a round (see ``encode_state``)
+with elements stored as atomic numbers. Records are framed by a length
+prefix and a CRC32, so a torn write at the end of the log is detected and
+the last complete record wins.
+"""
+
+import os
+import struct
+import zlib
+
+from .elements import ELEMENTS
+from .game import RoundState
+
+FORMAT_VERSION = 2
+
+# Mode codes, in a fixed order so the encoding stays stable.
+MODE_CODES = ("name_to_symbol", "symbol_to_name", "name_to_number", "number_to_name", "random")
+_MODE_INDEX = {mode: code for code, mode in enumerate(MODE_CODES)}
+
+# version, mode, num_questions, asked, retry_round, retry_pos, score, total,
+# len(pending), len(missed), len(scheduled)
+_HEADER = struct.Struct("<BBIIIIIIIII")
+_SCHEDULED = struct.Struct("<IBBB")  # due, atomic number, mode, attempts
+_FRAME = struct.Struct("<II")  # payload length, crc32 of payload
+
+
+def encode_state(state: RoundState, score: int, total: int) -> bytes:
+    """Encode round state and score as a compact binary payload.
+
+    Queued questions are stored as two bytes each: atomic number and mode
+    code. Spaced questions also carry when they are due and their attempts.
+    """
+    header = _HEADER.pack(FORMAT_VERSION, _MODE_INDEX[state.mode], state.num_questions, state.asked,
+                          state.retry_round, state.retry_pos, score, total,
+                          len(state.pending), len(state.missed), len(state.scheduled))
+    queue = bytes(value for queued in (state.pending, state.missed)
+                  for element, actual_mode in queued
+                  for value in (element[0], _MODE_INDEX[actual_mode]))
+    scheduled = b"".join(_SCHEDULED.pack(due, element[0], _MODE_INDEX[actual_mode], attempts)
+                         for due, element, actual_mode, attempts in state.scheduled)
+    return header + queue + scheduled
+
+
+def decode_state(payload: bytes) -> tuple:
+    """Decode a payload from encode_state into (state, score, total)."""
+    (version, mode, num_questions, asked, retry_round, retry_pos,
+     score, total, n_pending, n_missed, n_scheduled) = _HEADER.unpack_from(payload)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {version}")
+
+    queue_end = _HEADER.size + 2 * (n_pending + n_missed)
+    if len(payload) != queue_end + _SCHEDULED.size * n_scheduled:
+        raise ValueError("Checkpoint payload has the wrong length")
+    queue = payload[_HEADER.size:queue_end]
+    entries = [(ELEMENTS[queue[i] - 1], MODE_CODES[queue[i + 1]]) for i in range(0, len(queue), 2)]
+    scheduled = [(due, ELEMENTS[number - 1], MODE_CODES[code], attempts)
+                 for due, number, code, attempts in _SCHEDULED.iter_unpack(payload[queue_end:])]
+
+    state = RoundState(MODE_CODES[mode], num_questions, asked, retry_round, retry_pos,
+                       entries[:n_pending], entries[n_pending:], scheduled)
+    return (state, score, total)
+
+
+def frame(payload: bytes) -> bytes:
+    """Prefix a payload with its length and CRC32."""
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def iter_frames(data: bytes):
+    """Yield (payload, end_offset) from framed data, stopping at the first torn or corrupt record."""
+    offset = 0
+    while offset + _FRAME.size <= len(data):
+        length, crc = _FRAME.unpack_from(data, offset)
+        start = offset + _FRAME.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            return
+        offset = start + length
+        yield (payload, offset)
+
+
+class CheckpointLog:
+    """Append-only log of round state, passed to PeriodicQuiz.play_round.
+
+    Every append is flushed to the OS so it survives the process dying, and
+    the file is fsync'd once every ``fsync_every`` appends so it survives a
+    machine crash without paying for an fsync per answer.
+    """
+
+    def __init__(self, path, fsync_every: int = 16):
+        if fsync_every < 1:
+            raise ValueError("fsync_every must be at least 1")
+        self.path = path
+        self.fsync_every = fsync_every
+        self._file = None
+        self._unsynced = 0
+
+    def append(self, state: RoundState, score: int, total: int):
+        """Append a snapshot of the round."""
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        self._file.write(frame(encode_state(state, score, total)))
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+
+    def sync(self):
+        """Force appended records to disk."""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def load(self):
+        """Return (state, score, total) from the latest complete record, or None."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        latest, valid_end = None, 0
+        for payload, valid_end in iter_frames(data):
+            latest = payload
+        if valid_end < len(data):
+            # Cut off a torn tail so records appended after resuming stay readable.
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_end)
+        if latest is None:
+            return None
+        return decode_state(latest)
+
+    def clear(self):
+        """Discard the log once the round it describes is finished."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        """Sync and close the log file."""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
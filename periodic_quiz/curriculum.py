@@ -0,0 +1,119 @@
+"""Curricula: quizzes restricted to a subset of the elements.
+
+A Curriculum describes which elements to ask about. compile_pool turns it
+into a SamplingPool of elements and cumulative selection weights, cached by
+curriculum so every quiz with the same curriculum shares one pool.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from itertools import accumulate
+
+from .elements import ELEMENTS, get_element_by_symbol
+
+SamplingPool = namedtuple("SamplingPool", ["elements", "weights", "cum_weights"])
+
+
+def element_weight(element: tuple) -> int:
+    """Selection weight of an element. Elements discovered before 1946 are twice as likely."""
+    year = element[4]
+    if year == "ancient" or (isinstance(year, int) and year < 1946):
+        return 2
+    return 1
+
+
+class Curriculum:
+    """Which elements a quiz covers. Every given criterion must match.
+
+    numbers: (first, last) atomic numbers, inclusive.
+    discovered: (first, last) discovery years, inclusive; None leaves that end
+        open. Elements known since antiquity are earlier than any year.
+    valence: valence electron counts to include.
+    elements: explicit atomic numbers or symbols to include.
+    """
+
+    __slots__ = ("numbers", "discovered", "valence", "elements")
+
+    def __init__(self, numbers: tuple = None, discovered: tuple = None, valence=None, elements=None):
+        if numbers is not None:
+            first, last = numbers
+            if not 1 <= first <= last <= len(ELEMENTS):
+                raise ValueError(f"Atomic number range must be within 1-{len(ELEMENTS)}, got {first}-{last}")
+            numbers = (first, last)
+        if discovered is not None:
+            first, last = discovered
+            if first is not None and last is not None and first > last:
+                raise ValueError(f"Discovery range starts after it ends: {first}-{last}")
+            discovered = (first, last)
+        if valence is not None:
+            valence = tuple(sorted(set(valence)))
+            if not all(0 <= v <= 8 for v in valence):
+                raise ValueError(f"Valence electrons must be 0-8, got {valence}")
+        if elements is not None:
+            elements = tuple(sorted({self._atomic_number(e) for e in elements}))
+
+        self.numbers = numbers
+        self.discovered = discovered
+        self.valence = valence
+        self.elements = elements
+
+    @staticmethod
+    def _atomic_number(element) -> int:
+        if isinstance(element, int):
+            if not 1 <= element <= len(ELEMENTS):
+                raise ValueError(f"No element has atomic number {element}")
+            return element
+        found = get_element_by_symbol(element)
+        if found is None:
+            raise ValueError(f"Unknown element symbol: {element!r}")
+        return found[0]
+
+    def _key(self) -> tuple:
+        return (self.numbers, self.discovered, self.valence, self.elements)
+
+    def __eq__(self, other):
+        if not isinstance(other, Curriculum):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        criteria = ", ".join(f"{name}={value!r}" for name, value in zip(self.__slots__, self._key())
+                             if value is not None)
+        return f"Curriculum({criteria})"
+
+    def matches(self, element: tuple) -> bool:
+        """Check whether an element is part of this curriculum."""
+        atomic_num, symbol, name, valence, year = element
+        if self.numbers is not None and not self.numbers[0] <= atomic_num <= self.numbers[1]:
+            return False
+        if self.discovered is not None:
+            first, last = self.discovered
+            if year == "ancient":
+                if first is not None:
+                    return False
+            elif (first is not None and year < first) or (last is not None and year > last):
+                return False
+        if self.valence is not None and valence not in self.valence:
+            return False
+        if self.elements is not None and atomic_num not in self.elements:
+            return False
+        return True
+
+
+ALL_ELEMENTS = Curriculum()
+FIRST_20 = Curriculum(numbers=(1, 20))
+NOBLE_GASES = Curriculum(elements=("He", "Ne", "Ar", "Kr", "Xe", "Rn", "Og"))
+PRE_1900 = Curriculum(discovered=(None, 1899))
+
+
+@lru_cache(maxsize=256)
+def compile_pool(curriculum: Curriculum = ALL_ELEMENTS) -> SamplingPool:
+    """Build the sampling pool for a curriculum, once per distinct curriculum."""
+    elements = tuple(element for element in ELEMENTS if curriculum.matches(element))
+    if not elements:
+        raise ValueError(f"No elements match {curriculum!r}")
+    weights = tuple(element_weight(element) for element in elements)
+    return SamplingPool(elements, weights, tuple(accumulate(weights)))
@@ -1,14 +1,20 @@
 """Game logic for the periodic table quiz."""
 
+import heapq
 import random
+import time
+from collections import deque, namedtuple
 from difflib import SequenceMatcher
-from .elements import ELEMENTS
+from .curriculum import ALL_ELEMENTS, Curriculum, compile_pool
+from .elements import get_element_by_number
+from .normalize import normalize_answer, resolve_name, resolve_symbol
+from .timing import TimedMode
 
 
 def is_close_match(answer: str, correct: str, threshold: float = 0.8) -> bool:
     """Check if answer is close enough to correct (allows small typos)."""
-    answer = answer.lower().strip()
-    correct = correct.lower().strip()
+    answer = normalize_answer(answer)
+    correct = normalize_answer(correct)
 
     if answer == correct:
         return True
@@ -17,6 +23,107 @@ def is_close_match(answer: str, correct: str, threshold: float = 0.8) -> bool:
     return ratio >= threshold
 
 
+class RoundState:
+    """Progress through a single call to play_round, enough to resume it.
+
+    Main questions are counted by ``asked``. Questions missed in the main
+    stream wait in ``missed``, or in the ``scheduled`` heap of
+    (due, element, actual_mode, attempts) when the retry strategy spaces
+    them back into the stream. Once the main questions are done, the
+    missed questions become ``pending`` for retry round 1; ``retry_pos``
+    counts the questions already asked in the current retry round.
+    """
+
+    __slots__ = ("mode", "num_questions", "asked", "retry_round", "retry_pos",
+                 "pending", "missed", "scheduled")
+
+    def __init__(self, mode: str, num_questions: int, asked: int = 0, retry_round: int = 0,
+                 retry_pos: int = 0, pending=(), missed=(), scheduled=()):
+        self.mode = mode
+        self.num_questions = num_questions
+        self.asked = asked
+        self.retry_round = retry_round
+        self.retry_pos = retry_pos
+        self.pending = deque(pending)  # (element, actual_mode) tuples
+        self.missed = deque(missed)
+        self.scheduled = list(scheduled)
+        heapq.heapify(self.scheduled)
+
+    def queued(self) -> int:
+        """Number of missed questions waiting to be asked again."""
+        return len(self.pending) + len(self.missed) + len(self.scheduled)
+
+    def next_retry_round(self):
+        """Move the missed questions into a new retry round."""
+        while self.scheduled:
+            _, element, actual_mode, _ = heapq.heappop(self.scheduled)
+            self.missed.append((element, actual_mode))
+        self.pending = self.missed
+        self.missed = deque()
+        self.retry_pos = 0
+        self.retry_round += 1
+
+    def __eq__(self, other):
+        if not isinstance(other, RoundState):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+
+class RetryStrategy:
+    """How play_round re-asks missed questions.
+
+    max_rounds: retry rounds to run after the main questions (None for no limit).
+    time_budget: seconds allowed for the retry rounds (None for no limit).
+    spacing: if positive, a missed question is re-inserted into the main
+        question stream after ``spacing * 2 ** attempts`` new questions
+        instead of waiting for the retry rounds.
+    max_queue: most missed questions kept for retrying (defaults to the
+        number of questions in the round). Misses beyond it are not re-asked.
+    """
+
+    MAX_ATTEMPTS = 16  # Caps the exponential spacing interval
+
+    def __init__(self, max_rounds: int = None, time_budget: float = None, spacing: int = 0,
+                 max_queue: int = None):
+        if max_rounds is not None and max_rounds < 0:
+            raise ValueError("max_rounds must not be negative")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError("time_budget must be positive")
+        if spacing < 0:
+            raise ValueError("spacing must not be negative")
+        if max_queue is not None and max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        self.max_rounds = max_rounds
+        self.time_budget = time_budget
+        self.spacing = spacing
+        self.max_queue = max_queue
+
+    def requeue(self, state: RoundState, element: tuple, actual_mode: str, attempts: int = 0) -> bool:
+        """Queue a missed question to be asked again. Returns False if the queue is full."""
+        limit = self.max_queue if self.max_queue is not None else state.num_questions
+        if state.queued() >= limit:
+            return False
+
+        if self.spacing and state.asked < state.num_questions:
+            attempts = min(attempts, self.MAX_ATTEMPTS)
+            due = state.asked + self.spacing * 2 ** attempts
+            heapq.heappush(state.scheduled, (due, element, actual_mode, attempts + 1))
+        else:
+            state.missed.append((element, actual_mode))
+        return True
+
+    def exhausted(self, state: RoundState, retry_started: float) -> bool:
+        """Check whether the retry rounds have used up their round or time limit."""
+        if self.max_rounds is not None and state.retry_round > self.max_rounds:
+            return True
+        if self.time_budget is not None and time.monotonic() - retry_started >= self.time_budget:
+            return True
+        return False
+
+
+RoundResult = namedtuple("RoundResult", ["score", "total", "percentage", "duration", "retry_rounds"])
+
+
 class PeriodicQuiz:
     """Quiz game for learning the periodic table."""
 
@@ -28,22 +135,37 @@ class PeriodicQuiz:
         "5": ("Random Mix", "random"),
     }
 
-    def __init__(self):
+    def __init__(self, timed: TimedMode = None, responder=None, curriculum: Curriculum = None):
         self.score = 0
         self.total = 0
-        self.elements = list(ELEMENTS)
-        self._weights = self._calculate_weights()
-
-    def _calculate_weights(self) -> list:
-        """Calculate selection weights. Elements discovered before 1946 are twice as likely."""
-        weights = []
-        for element in self.elements:
-            year = element[4]
-            if year == "ancient" or (isinstance(year, int) and year < 1946):
-                weights.append(2)
-            else:
-                weights.append(1)
-        return weights
+        self.timed = timed
+        self.responder = responder  # Called as responder(mode, element) instead of input()
+        # Pools are shared between every quiz with the same curriculum; don't mutate them.
+        pool = compile_pool(curriculum or ALL_ELEMENTS)
+        self.curriculum = curriculum
+        self.elements = pool.elements
+        self._weights = pool.weights
+        self._cum_weights = pool.cum_weights
+
+    def read_answer(self, mode: str, element: tuple) -> str:
+        """Get the answer to a question from the responder, or from the terminal.
+
+        In timed mode the response time is recorded, and an answer given after
+        the per-question deadline is discarded so it is graded as incorrect.
+        """
+        started = self.timed.clock() if self.timed is not None else None
+        if self.responder is not None:
+            answer = self.responder(mode, element).strip()
+        else:
+            answer = input("Your answer: ").strip()
+
+        if self.timed is not None:
+            latency = self.timed.clock() - started
+            self.timed.record(element, latency)
+            if self.timed.too_slow(latency):
+                print(f"Too slow! You took {latency:.1f}s (limit {self.timed.deadline:g}s)")
+                return ""
+        return answer
 
     def reset_score(self):
         """Reset the score counters."""
@@ -52,15 +174,15 @@ class PeriodicQuiz:
 
     def get_random_element(self) -> tuple:
         """Get a random element, weighted so pre-1946 elements are twice as likely."""
-        return random.choices(self.elements, weights=self._weights, k=1)[0]
+        return random.choices(self.elements, cum_weights=self._cum_weights, k=1)[0]
 
     def ask_name_to_symbol(self, element: tuple) -> bool:
         """Ask user to provide symbol given the element name."""
         atomic_num, symbol, name, valence, year = element
         print(f"\nWhat is the chemical symbol for {name}?")
-        answer = input("Your answer: ").strip()
+        answer = self.read_answer("name_to_symbol", element)
 
-        if answer.lower() == symbol.lower():
+        if resolve_symbol(answer) == atomic_num:
             print(f"Correct! {name} = {symbol} (valence: {valence}, discovered: {year})")
             return True
         else:
@@ -71,12 +193,13 @@ class PeriodicQuiz:
         """Ask user to provide name given the symbol."""
         atomic_num, symbol, name, valence, year = element
         print(f"\nWhat element has the symbol {symbol}?")
-        answer = input("Your answer: ").strip()
+        answer = self.read_answer("symbol_to_name", element)
 
-        if answer.lower() == name.lower():
+        matched = resolve_name(answer)
+        if matched == atomic_num:
             print(f"Correct! {symbol} = {name} (valence: {valence}, discovered: {year})")
             return True
-        elif is_close_match(answer, name):
+        elif matched is None and is_close_match(answer, name):
             print(f"Close enough! {symbol} = {name} (valence: {valence}, discovered: {year}) (you typed: {answer})")
             return True
         else:
@@ -87,7 +210,7 @@ class PeriodicQuiz:
         """Ask user to provide atomic number given the element name."""
         atomic_num, symbol, name, valence, year = element
         print(f"\nWhat is the atomic number of {name}?")
-        answer = input("Your answer: ").strip()
+        answer = self.read_answer("name_to_number", element)
 
         try:
             if int(answer) == atomic_num:
@@ -103,12 +226,13 @@ class PeriodicQuiz:
         """Ask user to provide element name given the atomic number."""
         atomic_num, symbol, name, valence, year = element
         print(f"\nWhat element has atomic number {atomic_num}?")
-        answer = input("Your answer: ").strip()
+        answer = self.read_answer("number_to_name", element)
 
-        if answer.lower() == name.lower():
+        matched = resolve_name(answer)
+        if matched == atomic_num:
             print(f"Correct! Atomic number {atomic_num} is {name} (valence: {valence}, discovered: {year})")
             return True
-        elif is_close_match(answer, name):
+        elif matched is None and is_close_match(answer, name):
             print(f"Close enough! Atomic number {atomic_num} is {name} (valence: {valence}, "
                   f"discovered: {year}) (you typed: {answer})")
             return True
@@ -142,54 +266,115 @@ class PeriodicQuiz:
 
         return (correct, element, actual_mode)
 
-    def play_round(self, mode: str, num_questions: int = 10):
-        """Play a round of the quiz."""
-        self.reset_score()
-        missed_questions = []  # List of (element, actual_mode) tuples to retry
+    def play_round(self, mode: str, num_questions: int = 10, checkpoint=None, strategy: RetryStrategy = None):
+        """Play a round of the quiz.
 
-        print(f"\n{'=' * 50}")
-        print(f"Starting quiz with {num_questions} questions!")
-        print(f"{'=' * 50}")
+        Missed questions are re-asked according to ``strategy``; the default
+        keeps retrying until every question has been answered correctly.
+        In timed mode with a round time, the round stops when time runs out.
+
+        If a checkpoint log is given, round state is saved to it after every
+        answer and an unfinished round found in it is resumed instead of
+        starting a new one. A resumed round restarts its retry time budget.
+        """
+        if strategy is None:
+            strategy = RetryStrategy()
+        started = time.monotonic()
+
+        saved = checkpoint.load() if checkpoint is not None else None
+        if saved is not None:
+            state, self.score, self.total = saved
+            print(f"\nResuming quiz: {state.asked}/{state.num_questions} questions asked, "
+                  f"score {self.score}/{self.total}")
+        else:
+            self.reset_score()
+            state = RoundState(mode, num_questions)
 
-        for i in range(num_questions):
-            print(f"\n--- Question {i + 1}/{num_questions} ---")
-            correct, element, actual_mode = self.ask_question(mode)
+            print(f"\n{'=' * 50}")
+            print(f"Starting quiz with {num_questions} questions!")
+            print(f"{'=' * 50}")
+
+        if self.timed is not None:
+            self.timed.start_round()
+
+        while state.asked < state.num_questions:
+            if self._time_up():
+                break
+            if state.scheduled and state.scheduled[0][0] <= state.asked:
+                _, element, actual_mode, attempts = heapq.heappop(state.scheduled)
+                print("\n--- Review: question missed earlier ---")
+                correct, _, _ = self.ask_question(actual_mode, element)
+            else:
+                print(f"\n--- Question {state.asked + 1}/{state.num_questions} ---")
+                correct, element, actual_mode = self.ask_question(state.mode)
+                attempts = 0
+                state.asked += 1
             if correct:
                 self.score += 1
             else:
-                missed_questions.append((element, actual_mode))
+                strategy.requeue(state, element, actual_mode, attempts)
             self.total += 1
+            if state.asked == state.num_questions:
+                state.next_retry_round()
+            self._save_checkpoint(checkpoint, state)
             print(f"Score: {self.score}/{self.total}")
 
         # Retry missed questions
-        if missed_questions:
-            print(f"\n{'=' * 50}")
-            print(f"RETRY: {len(missed_questions)} missed question(s)")
-            print(f"{'=' * 50}")
+        retry_started = time.monotonic()
+        while state.pending:
+            if self._time_up():
+                break
+            if strategy.exhausted(state, retry_started):
+                print(f"\nRetry limit reached: {state.queued()} question(s) left to review.")
+                break
+            if state.retry_round == 1 and state.retry_pos == 0:
+                print(f"\n{'=' * 50}")
+                print(f"RETRY: {len(state.pending)} missed question(s)")
+                print(f"{'=' * 50}")
+            if state.retry_pos == 0:
+                print(f"\n--- Retry Round {state.retry_round} ---")
+
+            element, actual_mode = state.pending.popleft()
+            state.retry_pos += 1
+            print(f"\n[Retry {state.retry_pos}/{state.retry_pos + len(state.pending)}]")
+            correct, _, _ = self.ask_question(actual_mode, element)
+            if correct:
+                self.score += 1
+            else:
+                strategy.requeue(state, element, actual_mode)
+            self.total += 1
+            if not state.pending:
+                state.next_retry_round()
+            self._save_checkpoint(checkpoint, state)
+            print(f"Score: {self.score}/{self.total}")
 
-            retry_round = 1
-            while missed_questions:
-                print(f"\n--- Retry Round {retry_round} ---")
-                still_missed = []
+        if checkpoint is not None:
+            checkpoint.clear()
+        self.show_final_score()
 
-                for i, (element, actual_mode) in enumerate(missed_questions):
-                    print(f"\n[Retry {i + 1}/{len(missed_questions)}]")
-                    correct, _, _ = self.ask_question(actual_mode, element)
-                    if correct:
-                        self.score += 1
-                    else:
-                        still_missed.append((element, actual_mode))
-                    self.total += 1
-                    print(f"Score: {self.score}/{self.total}")
+        # A retry round interrupted part-way through still counts as played.
+        retry_rounds = max(state.retry_round - 1, 0) + (1 if state.retry_pos else 0)
+        return RoundResult(self.score, self.total, self.percentage(), time.monotonic() - started, retry_rounds)
+
+    def _time_up(self) -> bool:
+        """Check whether a timed round has run out of time, announcing it if so."""
+        if self.timed is None or not self.timed.round_over():
+            return False
+        print(f"\nTime's up! ({self.timed.round_time:g}s round)")
+        return True
 
-                missed_questions = still_missed
-                retry_round += 1
+    def _save_checkpoint(self, checkpoint, state: "RoundState"):
+        """Append the current round state to the checkpoint log, if any."""
+        if checkpoint is not None:
+            checkpoint.append(state, self.score, self.total)
 
-        self.show_final_score()
+    def percentage(self) -> float:
+        """Score as a percentage of questions asked."""
+        return (self.score / self.total * 100) if self.total > 0 else 0
 
     def show_final_score(self):
         """Display the final score."""
-        percentage = (self.score / self.total * 100) if self.total > 0 else 0
+        percentage = self.percentage()
 
         print(f"\n{'=' * 50}")
         print("QUIZ COMPLETE!")
@@ -206,8 +391,22 @@ class PeriodicQuiz:
             print("Keep studying! You'll get there.")
         else:
             print("Time to hit the books! Practice makes perfect.")
+
+        if self.timed is not None and self.timed.round.count:
+            self.show_speed()
         print()
 
+    def show_speed(self):
+        """Display response times for the round and the slowest elements so far."""
+        latencies = self.timed.round
+        print(f"Speed: {latencies.count} answers, average {latencies.mean():.1f}s, "
+              f"median {latencies.percentile(50):.1f}s, 90th percentile {latencies.percentile(90):.1f}s")
+
+        slowest = self.timed.slowest_elements()
+        if slowest:
+            print("Slowest elements: " + ", ".join(
+                f"{get_element_by_number(number)[2]} ({median:.1f}s)" for number, median in slowest))
+
     def browse_elements(self):
         """Browse all elements in the periodic table."""
         print(f"\n{'=' * 70}")
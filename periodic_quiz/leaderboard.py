@@ -0,0 +1,169 @@
+"""Leaderboards of quiz results, stored in SQLite.
+
+Each board (a class, a school) is ranked over three windows: the current
+day, the current ISO week and all time. The top ``k`` results of the
+current window are kept in memory as a sorted list of at most ``k``
+entries, so a new result is ranked in O(k) and reading a leaderboard never
+touches the full history. Results are written to SQLite in batches.
+"""
+
+import bisect
+import sqlite3
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+
+WINDOWS = ("day", "week", "all")
+_WINDOW_TITLES = {"day": "today", "week": "this week", "all": "all time"}
+
+LeaderboardEntry = namedtuple("LeaderboardEntry",
+                              ["player", "score", "total", "percentage", "duration", "finished_at"])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    board TEXT NOT NULL,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    percentage REAL NOT NULL,
+    duration REAL NOT NULL,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_time ON results (board, finished_at);
+CREATE INDEX IF NOT EXISTS results_by_rank ON results (board, percentage DESC, score DESC, duration, finished_at);
+"""
+
+_RANK_ORDER = "percentage DESC, score DESC, duration ASC, finished_at ASC"
+
+
+def rank_key(entry: LeaderboardEntry) -> tuple:
+    """Sort key putting the best result first: highest percentage, then score, then fastest."""
+    return (-entry.percentage, -entry.score, entry.duration, entry.finished_at)
+
+
+def window_key(window: str, when: datetime) -> str:
+    """Name the day or week that when falls in; later windows sort after earlier ones."""
+    if window == "day":
+        return when.date().isoformat()
+    if window == "week":
+        year, week, _ = when.isocalendar()
+        return f"{year}-W{week:02d}"
+    if window == "all":
+        return "all"
+    raise ValueError(f"Unknown window: {window!r} (expected one of {', '.join(WINDOWS)})")
+
+
+def window_bounds(window: str, when: datetime) -> tuple:
+    """Return the (start, end) timestamps of the window containing when, in when's timezone."""
+    if window == "all":
+        return (float("-inf"), float("inf"))
+    start = datetime.combine(when.date(), time.min, tzinfo=when.tzinfo)
+    if window == "week":
+        start -= timedelta(days=when.weekday())
+        end = start + timedelta(weeks=1)
+    else:
+        end = start + timedelta(days=1)
+    return (start.timestamp(), end.timestamp())
+
+
+class Leaderboard:
+    """Top-k rankings of quiz results per board and time window.
+
+    path: SQLite database file (":memory:" for a throwaway board).
+    k: number of places kept on each leaderboard.
+    flush_every: buffered results that trigger a write to SQLite.
+    """
+
+    def __init__(self, path=":memory:", k: int = 10, flush_every: int = 50):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+        self.k = k
+        self.flush_every = flush_every
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        self._buffer = []  # (board, entry) rows not yet written
+        self._top = {}  # (board, window) -> (window key, ranked entries)
+
+    def submit(self, player: str, result, board: str = "school", when: datetime = None):
+        """Record a RoundResult from PeriodicQuiz.play_round for player on a board."""
+        when = when or datetime.now()
+        entry = LeaderboardEntry(player, result.score, result.total, result.percentage,
+                                 result.duration, when.timestamp())
+        self._buffer.append((board, entry))
+
+        for window in WINDOWS:
+            key = window_key(window, when)
+            cached = self._top.get((board, window))
+            if cached is not None and cached[0] == key:
+                self._insert(cached[1], entry)
+            elif cached is None or key > cached[0]:
+                # First result in a new window: rank it from storage and the buffer, which holds this entry.
+                self._top[(board, window)] = (key, self._load(board, window, when))
+
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def _insert(self, ranking: list, entry: LeaderboardEntry):
+        """Place entry in a ranking, keeping only the top k."""
+        key = rank_key(entry)
+        if len(ranking) >= self.k and key >= rank_key(ranking[-1]):
+            return
+        bisect.insort(ranking, entry, key=rank_key)
+        del ranking[self.k:]
+
+    def _load(self, board: str, window: str, when: datetime) -> list:
+        """Read the top k results of a window from SQLite and the write buffer."""
+        start, end = window_bounds(window, when)
+        rows = self._db.execute(
+            "SELECT player, score, total, percentage, duration, finished_at FROM results "
+            f"WHERE board = ? AND finished_at >= ? AND finished_at < ? ORDER BY {_RANK_ORDER} LIMIT ?",
+            (board, start, end, self.k))
+        ranking = [LeaderboardEntry(*row) for row in rows]
+        for buffered_board, entry in self._buffer:
+            if buffered_board == board and start <= entry.finished_at < end:
+                self._insert(ranking, entry)
+        return ranking
+
+    def top(self, board: str = "school", window: str = "all", when: datetime = None) -> list:
+        """Return the ranked top-k entries of a board for the window containing when (default now)."""
+        when = when or datetime.now()
+        key = window_key(window, when)
+        cached = self._top.get((board, window))
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
+
+        ranking = self._load(board, window, when)
+        if cached is None or key > cached[0]:
+            self._top[(board, window)] = (key, ranking)
+        return list(ranking)
+
+    def flush(self):
+        """Write buffered results to SQLite."""
+        if not self._buffer:
+            return
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO results (board, player, score, total, percentage, duration, finished_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(board, *entry) for board, entry in self._buffer])
+        self._buffer.clear()
+
+    def close(self):
+        """Flush buffered results and close the database."""
+        self.flush()
+        self._db.close()
+
+    def show(self, board: str = "school", window: str = "all"):
+        """Display a leaderboard."""
+        entries = self.top(board, window)
+        print(f"\n{'=' * 50}")
+        print(f"LEADERBOARD: {board} ({_WINDOW_TITLES[window]})")
+        print(f"{'=' * 50}")
+        print(f"{'#':<4} {'Player':<16} {'Score':<9} {'%':>6} {'Time':>8}")
+        print("-" * 50)
+        for place, entry in enumerate(entries, 1):
+            print(f"{place:<4} {entry.player:<16} {f'{entry.score}/{entry.total}':<9} "
+                  f"{entry.percentage:>5.1f}% {entry.duration:>7.1f}s")
+        if not entries:
+            print("No results yet.")
@@ -0,0 +1,54 @@
+"""Answer normalization applied before answers are graded.
+
+Answers are reduced to a canonical form (compatibility-decomposed, without
+diacritics or punctuation, casefolded, single-spaced) and looked up in
+maps precomputed over ELEMENTS, so accented, fullwidth and alternate
+spellings are accepted with a dictionary hit instead of fuzzy matching.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+from .elements import ELEMENTS
+
+# Accepted alternate spellings -> the name used in ELEMENTS.
+ALIASES = {
+    "Caesium": "Cesium",
+    "Aluminium": "Aluminum",
+    "Sulphur": "Sulfur",
+}
+
+_PUNCTUATION = re.compile(r"[^\w\s]|_")
+
+
+@lru_cache(maxsize=4096)
+def normalize_answer(text: str) -> str:
+    """Reduce an answer to the canonical form used for comparisons."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = _PUNCTUATION.sub("", text.casefold())
+    return " ".join(text.split())
+
+
+def _build_name_index() -> dict:
+    index = {normalize_answer(name): atomic_num for atomic_num, symbol, name, valence, year in ELEMENTS}
+    for alias, name in ALIASES.items():
+        index[normalize_answer(alias)] = index[normalize_answer(name)]
+    return index
+
+
+# Normalized name or alias -> atomic number
+NAME_INDEX = _build_name_index()
+# Normalized symbol -> atomic number
+SYMBOL_INDEX = {normalize_answer(symbol): atomic_num for atomic_num, symbol, name, valence, year in ELEMENTS}
+
+
+def resolve_name(answer: str):
+    """Return the atomic number of the element an answer names exactly, or None."""
+    return NAME_INDEX.get(normalize_answer(answer))
+
+
+def resolve_symbol(answer: str):
+    """Return the atomic number of the element whose symbol an answer is, or None."""
+    return SYMBOL_INDEX.get(normalize_answer(answer))
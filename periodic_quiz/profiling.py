@@ -0,0 +1,99 @@
+"""Profiling support for the quiz CLI.
+
+A profiled session runs under cProfile, which is saved as a pstats file,
+while a background thread samples the session's call stack and saves the
+counts in the collapsed-stack format read by flamegraph.pl and speedscope.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def frame_label(frame) -> str:
+    """Name a stack frame as module:function."""
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", os.path.basename(code.co_filename))
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class StackSampler:
+    """Periodically records the call stack of one thread."""
+
+    def __init__(self, thread_id: int = None, interval: float = 0.001):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.stacks = Counter()  # "root;...;leaf" -> samples
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write_collapsed(self, path):
+        """Write samples as "frame;frame;frame count" lines."""
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def package_hotspots(stats: pstats.Stats, limit: int = 10) -> list:
+    """Return (function, calls, own seconds, cumulative seconds) for the package's hottest functions."""
+    rows = []
+    for (filename, lineno, funcname), (_, calls, own, cumulative, _) in stats.stats.items():
+        if os.path.abspath(filename).startswith(PACKAGE_DIR):
+            rows.append((f"{os.path.basename(filename)}:{lineno}({funcname})", calls, own, cumulative))
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows[:limit]
+
+
+def show_hotspots(rows: list):
+    """Display the hottest functions in the package."""
+    print(f"\n{'=' * 70}")
+    print("PROFILE: hottest functions in periodic_quiz (by own time)")
+    print(f"{'=' * 70}")
+    print(f"{'Function':<40} {'Calls':>8} {'Own (s)':>9} {'Cum (s)':>9}")
+    print("-" * 70)
+    for function, calls, own, cumulative in rows:
+        print(f"{function:<40} {calls:>8} {own:>9.4f} {cumulative:>9.4f}")
+
+
+def run_profiled(func, output_prefix: str, interval: float = 0.001):
+    """Run func under cProfile and a stack sampler, writing <prefix>.pstats and <prefix>.collapsed.
+
+    The profile is written and summarized even if func raises.
+    """
+    profiler = cProfile.Profile()
+    sampler = StackSampler(interval=interval)
+    sampler.start()
+    profiler.enable()
+    try:
+        return func()
+    finally:
+        profiler.disable()
+        sampler.stop()
+
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(f"{output_prefix}.pstats")
+        sampler.write_collapsed(f"{output_prefix}.collapsed")
+        show_hotspots(package_hotspots(stats))
+        print(f"\nProfile written to {output_prefix}.pstats and {output_prefix}.collapsed")
@@ -0,0 +1,190 @@
+"""Session manager for running many quizzes in one process.
+
+Every session shares the element table and weights of its curriculum's
+sampling pool, so a session only holds a few counters and, while a round
+is in progress, its state encoded as a compact checkpoint record. Idle
+sessions are spilled to disk and loaded again when next used.
+"""
+
+import json
+import os
+import re
+import struct
+import sys
+import time
+from collections import OrderedDict
+
+from .checkpoint import decode_state, encode_state, frame, iter_frames
+from .curriculum import Curriculum, compile_pool
+from .game import PeriodicQuiz, RetryStrategy
+
+_SESSION_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+_SPILL_HEADER = struct.Struct("<III")  # score, total, length of the curriculum JSON
+
+
+class Session:
+    """One student's quiz progress.
+
+    A Session is the checkpoint passed to PeriodicQuiz.play_round, so an
+    interrupted round is kept here, already encoded, until it is resumed.
+    """
+
+    __slots__ = ("session_id", "curriculum", "score", "total", "snapshot", "last_used")
+
+    def __init__(self, session_id: str, curriculum: Curriculum = None, score: int = 0, total: int = 0,
+                 snapshot: bytes = None):
+        self.session_id = session_id
+        self.curriculum = curriculum
+        self.score = score
+        self.total = total
+        self.snapshot = snapshot  # encode_state() of an unfinished round
+        self.last_used = 0.0
+
+    def load(self):
+        """Return (state, score, total) of an unfinished round, or None."""
+        return decode_state(self.snapshot) if self.snapshot is not None else None
+
+    def append(self, state, score: int, total: int):
+        """Save the state of the round in progress."""
+        self.snapshot = encode_state(state, score, total)
+
+    def clear(self):
+        """Forget the round once it is finished."""
+        self.snapshot = None
+
+    def to_bytes(self) -> bytes:
+        """Serialize the session for spilling to disk."""
+        curriculum = b""
+        if self.curriculum is not None:
+            c = self.curriculum
+            curriculum = json.dumps([c.numbers, c.discovered, c.valence, c.elements]).encode()
+        payload = _SPILL_HEADER.pack(self.score, self.total, len(curriculum)) + curriculum + (self.snapshot or b"")
+        return frame(payload)
+
+    @classmethod
+    def from_bytes(cls, session_id: str, data: bytes) -> "Session":
+        """Rebuild a session written by to_bytes."""
+        for payload, _ in iter_frames(data):
+            break
+        else:
+            raise ValueError(f"Spilled session {session_id!r} is corrupt")
+        score, total, curriculum_length = _SPILL_HEADER.unpack_from(payload)
+        start = _SPILL_HEADER.size
+        curriculum = None
+        if curriculum_length:
+            curriculum = Curriculum(*json.loads(payload[start:start + curriculum_length]))
+        snapshot = payload[start + curriculum_length:] or None
+        return cls(session_id, curriculum, score, total, snapshot)
+
+
+class SessionManager:
+    """Keeps recently used sessions in memory and spills idle ones to disk.
+
+    spill_dir: directory for spilled sessions.
+    max_sessions: most sessions kept in memory; the least recently used go first.
+    ttl: seconds a session may sit idle in memory before it is spilled.
+    clock: monotonic clock returning seconds.
+    strategy: RetryStrategy for rounds played through the manager. The
+        default bounds retries by rounds and time, so no session can keep
+        retrying forever.
+
+    A manager is not thread-safe; give each worker thread its own.
+    """
+
+    DEFAULT_STRATEGY = RetryStrategy(max_rounds=3, time_budget=600.0)
+
+    def __init__(self, spill_dir, max_sessions: int = 1000, ttl: float = 900.0, clock=time.monotonic,
+                 strategy: RetryStrategy = None):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.spill_dir = spill_dir
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.clock = clock
+        self.strategy = strategy if strategy is not None else self.DEFAULT_STRATEGY
+        self._sessions = OrderedDict()  # session_id -> Session, least recently used first
+        os.makedirs(spill_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def _spill_path(self, session_id: str) -> str:
+        return os.path.join(self.spill_dir, f"{session_id}.session")
+
+    def session(self, session_id: str, curriculum: Curriculum = None) -> Session:
+        """Return a session, loading it from disk or creating it if needed.
+
+        The curriculum only applies to a newly created session.
+        """
+        if not _SESSION_ID.fullmatch(session_id):
+            raise ValueError(f"Invalid session id: {session_id!r}")
+
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._sessions.move_to_end(session_id)
+        else:
+            path = self._spill_path(session_id)
+            try:
+                with open(path, "rb") as f:
+                    session = Session.from_bytes(session_id, f.read())
+                os.remove(path)
+            except FileNotFoundError:
+                if curriculum is not None:
+                    compile_pool(curriculum)  # Reject an empty curriculum before creating the session
+                session = Session(session_id, curriculum)
+            self._sessions[session_id] = session
+
+        session.last_used = self.clock()
+        self.evict()
+        return session
+
+    def play_round(self, session_id: str, mode: str, num_questions: int = 10, responder=None,
+                   strategy: RetryStrategy = None):
+        """Play a round for a session, resuming its unfinished round if it has one.
+
+        Missed questions are retried with ``strategy``, or the manager's strategy if not given.
+        """
+        session = self.session(session_id)
+        quiz = PeriodicQuiz(responder=responder, curriculum=session.curriculum)
+        result = quiz.play_round(mode, num_questions, checkpoint=session,
+                                 strategy=strategy if strategy is not None else self.strategy)
+        session.score, session.total = result.score, result.total
+        session.last_used = self.clock()
+        if session_id in self._sessions:
+            self._sessions.move_to_end(session_id)
+        return result
+
+    def spill(self, session_id: str):
+        """Write a session to disk and drop it from memory."""
+        session = self._sessions.pop(session_id)
+        path = self._spill_path(session_id)
+        with open(path + ".tmp", "wb") as f:
+            f.write(session.to_bytes())
+        os.replace(path + ".tmp", path)
+
+    def evict(self) -> int:
+        """Spill sessions over the memory limit or idle past the TTL. Returns how many were spilled."""
+        spilled = 0
+        expired = self.clock() - self.ttl
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if len(self._sessions) <= self.max_sessions and session.last_used > expired:
+                break
+            self.spill(session_id)
+            spilled += 1
+        return spilled
+
+    def memory_report(self) -> dict:
+        """Measure memory held by in-memory sessions, excluding the shared element tables."""
+        per_session = [sys.getsizeof(s) + sys.getsizeof(s.session_id)
+                       + (sys.getsizeof(s.snapshot) if s.snapshot is not None else 0)
+                       for s in self._sessions.values()]
+        count = len(per_session)
+        return {
+            "sessions": count,
+            "session_bytes": sum(per_session),
+            "bytes_per_session": sum(per_session) / count if count else 0.0,
+            "index_bytes": sys.getsizeof(self._sessions),
+        }
@@ -0,0 +1,233 @@
+"""Headless load harness that plays quiz rounds with simulated students.
+
+Run with: python -m periodic_quiz.simulate --rounds 5000 --workers 4
+"""
+
+import argparse
+import contextlib
+import math
+import os
+import random
+import string
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from . import non_negative_int, positive_int
+from .elements import ELEMENTS
+from .game import PeriodicQuiz, RetryStrategy
+from .timing import LatencyHistogram, TimedMode
+
+QUIZ_MODES = tuple(mode for _, mode in PeriodicQuiz.MODES.values())
+
+
+def correct_answer(mode: str, element: tuple) -> str:
+    """The expected answer to a question in the given mode."""
+    atomic_num, symbol, name, valence, year = element
+    if mode == "name_to_symbol":
+        return symbol
+    if mode == "name_to_number":
+        return str(atomic_num)
+    return name
+
+
+def make_typo(word: str, rng: random.Random, threshold: float = 0.8) -> str:
+    """Misspell word with just enough edits to land on either side of is_close_match's threshold.
+
+    Each edit costs roughly one matching character, so a word of length n
+    stays a close match with up to floor(n * (1 - threshold)) edits. The
+    typo uses either that many edits or one more, chosen at random.
+    """
+    limit = math.floor(len(word) * (1 - threshold) + 1e-9)
+    edits = max(1, limit + rng.choice((0, 1)))
+
+    letters = list(word)
+    for _ in range(edits):
+        kind = rng.choice(("substitute", "delete", "insert", "transpose"))
+        pos = rng.randrange(len(letters)) if letters else 0
+        if kind == "substitute" and letters:
+            letters[pos] = rng.choice([c for c in string.ascii_lowercase if c != letters[pos].lower()])
+        elif kind == "delete" and len(letters) > 1:
+            del letters[pos]
+        elif kind == "transpose" and len(letters) > 1:
+            pos = min(pos, len(letters) - 2)
+            letters[pos], letters[pos + 1] = letters[pos + 1], letters[pos]
+        else:
+            letters.insert(pos, rng.choice(string.ascii_lowercase))
+    return "".join(letters)
+
+
+class SimulatedClock:
+    """Clock that only moves when a simulated student takes time to answer."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SimulatedPlayer:
+    """A synthetic student, used as a PeriodicQuiz responder.
+
+    accuracy: chance of knowing the right answer.
+    typo_rate: chance of misspelling a known element name.
+    latency_median, latency_sigma: log-normal response time, in seconds.
+    """
+
+    def __init__(self, accuracy: float = 0.8, typo_rate: float = 0.1, latency_median: float = 3.0,
+                 latency_sigma: float = 0.5, seed: int = None):
+        if not 0 <= accuracy <= 1:
+            raise ValueError("accuracy must be between 0 and 1")
+        if not 0 <= typo_rate <= 1:
+            raise ValueError("typo_rate must be between 0 and 1")
+        if latency_median <= 0 or latency_sigma < 0:
+            raise ValueError("latency_median must be positive and latency_sigma not negative")
+        self.accuracy = accuracy
+        self.typo_rate = typo_rate
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.rng = random.Random(seed)
+        self.clock = SimulatedClock()
+
+    def __call__(self, mode: str, element: tuple) -> str:
+        self.clock.now += self.rng.lognormvariate(math.log(self.latency_median), self.latency_sigma)
+
+        if self.rng.random() >= self.accuracy:
+            wrong = self.rng.choice([e for e in ELEMENTS if e[0] != element[0]])
+            return correct_answer(mode, wrong)
+
+        answer = correct_answer(mode, element)
+        if mode in ("symbol_to_name", "number_to_name") and self.rng.random() < self.typo_rate:
+            return make_typo(answer, self.rng)
+        return answer
+
+
+def run_batch(rounds: int, num_questions: int, mode: str, player_options: dict, max_rounds: int,
+              seed: int) -> dict:
+    """Play rounds in this process and return their raw statistics.
+
+    The global random module, which PeriodicQuiz samples from, is seeded for
+    reproducibility and restored afterwards so callers are not affected.
+    """
+    saved_random_state = random.getstate()
+    random.seed(seed)
+    try:
+        return _play_batch(rounds, num_questions, mode, player_options, max_rounds, seed)
+    finally:
+        random.setstate(saved_random_state)
+
+
+def _play_batch(rounds: int, num_questions: int, mode: str, player_options: dict, max_rounds: int,
+                seed: int) -> dict:
+    player = SimulatedPlayer(seed=seed, **player_options)
+    quiz = PeriodicQuiz(timed=TimedMode(clock=player.clock), responder=player)
+    strategy = RetryStrategy(max_rounds=max_rounds)
+    depths = Counter()
+    latency = LatencyHistogram()
+    questions = correct = 0
+
+    cpu_started = time.process_time()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(rounds):
+            result = quiz.play_round(mode, num_questions, strategy=strategy)
+            depths[result.retry_rounds] += 1
+            questions += result.total
+            correct += result.score
+            latency.merge(quiz.timed.round)
+    return {
+        "rounds": rounds,
+        "questions": questions,
+        "correct": correct,
+        "cpu_seconds": time.process_time() - cpu_started,
+        "depths": depths,
+        "latency": latency,
+    }
+
+
+def simulate(rounds: int = 1000, workers: int = None, num_questions: int = 10, mode: str = "random",
+             max_rounds: int = 10, seed: int = 0, **player_options) -> dict:
+    """Play rounds with simulated students across a process pool and summarize them.
+
+    With workers=1 the rounds run in this process, which keeps them visible
+    to a profiler. Extra keyword arguments configure each SimulatedPlayer.
+    """
+    if rounds < 1:
+        raise ValueError("rounds must be at least 1")
+    if num_questions < 1:
+        raise ValueError("num_questions must be at least 1")
+    if mode not in QUIZ_MODES:
+        raise ValueError(f"Unknown mode: {mode!r} (expected one of {', '.join(QUIZ_MODES)})")
+    workers = workers or os.cpu_count() or 1
+    batches = min(rounds, workers * 4)
+    sizes = [rounds // batches + (1 if i < rounds % batches else 0) for i in range(batches)]
+    jobs = [(size, num_questions, mode, player_options, max_rounds, seed + i) for i, size in enumerate(sizes)]
+
+    wall_started = time.perf_counter()
+    if workers == 1:
+        results = [run_batch(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_batch, *zip(*jobs)))
+    wall_seconds = time.perf_counter() - wall_started
+
+    questions = sum(r["questions"] for r in results)
+    cpu_seconds = sum(r["cpu_seconds"] for r in results)
+    depths = sum((r["depths"] for r in results), Counter())
+    latency = LatencyHistogram()
+    for r in results:
+        latency.merge(r["latency"])
+    return {
+        "rounds": rounds,
+        "questions": questions,
+        "accuracy": sum(r["correct"] for r in results) / questions * 100,
+        "wall_seconds": wall_seconds,
+        "questions_per_second": questions / wall_seconds if wall_seconds else 0.0,
+        "cpu_seconds": cpu_seconds,
+        "cpu_per_question": cpu_seconds / questions,
+        "retry_depths": dict(sorted(depths.items())),
+        "latency": latency,
+    }
+
+
+def print_report(report: dict):
+    """Display a simulation summary."""
+    print(f"\n{'=' * 50}")
+    print("SIMULATION REPORT")
+    print(f"{'=' * 50}")
+    print(f"Rounds: {report['rounds']}  Questions: {report['questions']}  "
+          f"Accuracy: {report['accuracy']:.1f}%")
+    print(f"Wall time: {report['wall_seconds']:.2f}s  "
+          f"Throughput: {report['questions_per_second']:,.0f} questions/s")
+    print(f"CPU time: {report['cpu_seconds']:.2f}s  "
+          f"({report['cpu_per_question'] * 1e6:.1f} µs per question)")
+    print("Retry-round depth:")
+    for depth, count in report["retry_depths"].items():
+        print(f"  {depth:>3}: {count} round(s) ({count / report['rounds'] * 100:.1f}%)")
+    latency = report["latency"]
+    print(f"Simulated answer time: median {latency.percentile(50):.1f}s, "
+          f"90th percentile {latency.percentile(90):.1f}s")
+
+
+def main(argv=None):
+    """Command-line entry point for the simulation harness."""
+    parser = argparse.ArgumentParser(description="Play quiz rounds with simulated students.")
+    parser.add_argument("--rounds", type=positive_int, default=1000, help="rounds to play (default 1000)")
+    parser.add_argument("--workers", type=positive_int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--questions", type=positive_int, default=10, help="questions per round (default 10)")
+    parser.add_argument("--mode", default="random", choices=QUIZ_MODES,
+                        help="quiz mode (default random)")
+    parser.add_argument("--max-rounds", type=non_negative_int, default=10, help="retry rounds per quiz (default 10)")
+    parser.add_argument("--accuracy", type=float, default=0.8, help="chance of a right answer (default 0.8)")
+    parser.add_argument("--typo-rate", type=float, default=0.1, help="chance of a misspelled name (default 0.1)")
+    parser.add_argument("--latency", type=float, default=3.0, help="median answer time in seconds (default 3)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default 0)")
+    args = parser.parse_args(argv)
+
+    report = simulate(args.rounds, args.workers, args.questions, args.mode, args.max_rounds, args.seed,
+                      accuracy=args.accuracy, typo_rate=args.typo_rate, latency_median=args.latency)
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
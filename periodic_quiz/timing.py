@@ -0,0 +1,120 @@
+"""Response-time tracking for timed (speed drill) quizzes."""
+
+import math
+import time
+
+
+class LatencyHistogram:
+    """Streaming histogram of response times with a fixed number of buckets.
+
+    Buckets grow geometrically from MIN_SECONDS, eight per doubling, so any
+    percentile is accurate to within about 9% no matter how many samples
+    are recorded, and memory never grows past the bucket array.
+    """
+
+    MIN_SECONDS = 0.001
+    BUCKETS_PER_DOUBLING = 8
+    NUM_BUCKETS = 20 * BUCKETS_PER_DOUBLING + 1  # 1ms up to about 17 minutes
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * self.NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= self.MIN_SECONDS:
+            return 0
+        index = math.ceil(math.log2(seconds / self.MIN_SECONDS) * self.BUCKETS_PER_DOUBLING)
+        return min(index, self.NUM_BUCKETS - 1)
+
+    def record(self, seconds: float):
+        """Add one response time."""
+        self.counts[self._bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add another histogram's samples to this one."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def mean(self) -> float:
+        """Average response time (0 if nothing recorded)."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Estimate the response time below which pct percent of responses fall."""
+        if not 0 <= pct <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * pct / 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                upper = self.MIN_SECONDS * 2 ** (index / self.BUCKETS_PER_DOUBLING)
+                return min(max(upper, self.min), self.max)
+        return self.max
+
+
+class TimedMode:
+    """Settings and measurements for a timed quiz.
+
+    deadline: seconds allowed per question; slower answers count as wrong.
+        The deadline is checked once the answer is given; it does not
+        interrupt a student who is still typing at the input() prompt.
+    round_time: seconds allowed for a whole round before it stops early.
+    clock: monotonic clock returning seconds, time.perf_counter by default.
+    """
+
+    def __init__(self, deadline: float = None, round_time: float = None, clock=time.perf_counter):
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+        if round_time is not None and round_time <= 0:
+            raise ValueError("round_time must be positive")
+        self.deadline = deadline
+        self.round_time = round_time
+        self.clock = clock
+        self.round = LatencyHistogram()
+        self.by_element = {}  # atomic number -> LatencyHistogram, kept across rounds
+        self._round_started = None
+
+    def start_round(self):
+        """Start the round clock and clear the per-round statistics."""
+        self.round = LatencyHistogram()
+        self._round_started = self.clock()
+
+    def round_over(self) -> bool:
+        """Check whether the round's time box has run out."""
+        if self.round_time is None or self._round_started is None:
+            return False
+        return self.clock() - self._round_started >= self.round_time
+
+    def too_slow(self, seconds: float) -> bool:
+        """Check whether a response missed the per-question deadline."""
+        return self.deadline is not None and seconds > self.deadline
+
+    def record(self, element: tuple, seconds: float):
+        """Record how long the student took to answer a question about element."""
+        self.round.record(seconds)
+        histogram = self.by_element.get(element[0])
+        if histogram is None:
+            histogram = self.by_element[element[0]] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def slowest_elements(self, n: int = 3) -> list:
+        """Return (atomic_number, median seconds) for the n slowest elements."""
+        medians = [(number, histogram.percentile(50)) for number, histogram in self.by_element.items()]
+        medians.sort(key=lambda item: item[1], reverse=True)
+        return medians[:n]
@@ -0,0 +1,107 @@
+"""Unit tests for round checkpointing."""
+
+import pytest
+from unittest.mock import patch
+from periodic_quiz.checkpoint import CheckpointLog, decode_state, encode_state
+from periodic_quiz.game import PeriodicQuiz, RoundState
+
+HYDROGEN = (1, "H", "Hydrogen", 1, 1766)
+GOLD = (79, "Au", "Gold", 1, "ancient")
+
+
+class TestEncoding:
+    """Tests for the binary round-state encoding."""
+
+    def test_round_trip(self):
+        """Decoding an encoded state should give back the same state."""
+        state = RoundState("random", 12, asked=12, retry_round=2, retry_pos=1,
+                           pending=[(HYDROGEN, "name_to_symbol"), (GOLD, "number_to_name")],
+                           missed=[(HYDROGEN, "name_to_symbol")])
+        decoded, score, total = decode_state(encode_state(state, 9, 13))
+        assert decoded == state
+        assert (score, total) == (9, 13)
+
+    def test_round_trip_scheduled(self):
+        """Spaced questions should keep their due position and attempts."""
+        state = RoundState("name_to_symbol", 20, asked=5,
+                           scheduled=[(7, GOLD, "name_to_symbol", 1), (9, HYDROGEN, "name_to_symbol", 2)])
+        decoded, _, _ = decode_state(encode_state(state, 4, 5))
+        assert decoded == state
+
+    def test_elements_stored_as_atomic_numbers(self):
+        """Each queued question should cost two bytes."""
+        empty = encode_state(RoundState("random", 10), 0, 0)
+        one = encode_state(RoundState("random", 10, missed=[(GOLD, "name_to_symbol")]), 0, 0)
+        assert len(one) - len(empty) == 2
+
+
+class TestCheckpointLog:
+    """Tests for the append-only checkpoint log."""
+
+    def test_load_missing_file(self, tmp_path):
+        """A log that was never written should load as None."""
+        assert CheckpointLog(tmp_path / "round.ckpt").load() is None
+
+    def test_latest_record_wins(self, tmp_path):
+        """Loading should return the most recently appended state."""
+        log = CheckpointLog(tmp_path / "round.ckpt")
+        log.append(RoundState("name_to_symbol", 5, asked=1), 1, 1)
+        log.append(RoundState("name_to_symbol", 5, asked=2), 1, 2)
+        log.close()
+        state, score, total = log.load()
+        assert state.asked == 2
+        assert (score, total) == (1, 2)
+
+    def test_torn_tail_ignored(self, tmp_path):
+        """A partially written record should be dropped, keeping the one before it."""
+        path = tmp_path / "round.ckpt"
+        log = CheckpointLog(path)
+        log.append(RoundState("name_to_symbol", 5, asked=1), 1, 1)
+        log.append(RoundState("name_to_symbol", 5, asked=2), 2, 2)
+        log.close()
+        path.write_bytes(path.read_bytes()[:-3])
+
+        state, score, total = log.load()
+        assert state.asked == 1
+        log.append(RoundState("name_to_symbol", 5, asked=2), 1, 2)
+        log.close()
+        assert log.load()[0].asked == 2
+
+    def test_invalid_fsync_every(self, tmp_path):
+        """fsync_every must be positive."""
+        with pytest.raises(ValueError):
+            CheckpointLog(tmp_path / "round.ckpt", fsync_every=0)
+
+
+class TestResume:
+    """Tests for resuming play_round from a checkpoint."""
+
+    def setup_method(self):
+        self.quiz = PeriodicQuiz()
+        self.quiz.get_random_element = lambda: HYDROGEN
+
+    def test_resume_after_disconnect(self, tmp_path):
+        """A dropped round should resume with its score and retry queue intact."""
+        log = CheckpointLog(tmp_path / "round.ckpt")
+        with patch('builtins.input', side_effect=["1", "2", EOFError]):
+            with pytest.raises(EOFError):
+                self.quiz.play_round("name_to_number", 3, checkpoint=log)
+
+        state, score, total = log.load()
+        assert (state.asked, score, total) == (2, 1, 2)
+        assert list(state.missed) == [(HYDROGEN, "name_to_number")]
+
+        resumed = PeriodicQuiz()
+        resumed.get_random_element = lambda: HYDROGEN
+        with patch('builtins.input', side_effect=["1", "1"]) as mock_input:
+            resumed.play_round("name_to_number", 3, checkpoint=log)
+        assert mock_input.call_count == 2
+        assert (resumed.score, resumed.total) == (3, 4)
+        assert not (tmp_path / "round.ckpt").exists()
+
+    @patch('builtins.input', return_value='1')
+    def test_finished_round_clears_log(self, mock_input, tmp_path):
+        """A completed round should leave nothing to resume."""
+        log = CheckpointLog(tmp_path / "round.ckpt")
+        self.quiz.play_round("name_to_number", 2, checkpoint=log)
+        assert log.load() is None
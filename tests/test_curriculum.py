@@ -0,0 +1,66 @@
+"""Unit tests for curriculum filters."""
+
+import pytest
+from periodic_quiz.curriculum import (ALL_ELEMENTS, FIRST_20, NOBLE_GASES, PRE_1900, Curriculum,
+                                      compile_pool)
+from periodic_quiz.game import PeriodicQuiz
+
+
+class TestCurriculum:
+    """Tests for selecting element subsets."""
+
+    def test_number_range(self):
+        """An atomic number range should select exactly those elements."""
+        assert [e[0] for e in compile_pool(FIRST_20).elements] == list(range(1, 21))
+
+    def test_noble_gases(self):
+        """An explicit list should accept symbols."""
+        assert [e[1] for e in compile_pool(NOBLE_GASES).elements] == ["He", "Ne", "Ar", "Kr", "Xe", "Rn", "Og"]
+
+    def test_discovery_era(self):
+        """Ancient elements count as discovered before any year."""
+        elements = compile_pool(PRE_1900).elements
+        assert all(e[4] == "ancient" or e[4] <= 1899 for e in elements)
+        assert any(e[4] == "ancient" for e in elements)
+        modern = compile_pool(Curriculum(discovered=(1900, None))).elements
+        assert len(elements) + len(modern) == 118
+
+    def test_valence(self):
+        """A valence filter should combine with other criteria."""
+        elements = compile_pool(Curriculum(numbers=(1, 20), valence=[1])).elements
+        assert [e[1] for e in elements] == ["H", "Li", "Na", "K"]
+
+    def test_pool_cached_by_spec(self):
+        """Equal curricula should share one compiled pool."""
+        assert compile_pool(Curriculum(elements=[2, "Ne"])) is compile_pool(Curriculum(elements=["He", 10]))
+        assert PeriodicQuiz(curriculum=FIRST_20).elements is compile_pool(FIRST_20).elements
+
+    def test_pool_weights(self):
+        """Pools should keep the pre-1946 weighting, with matching cumulative weights."""
+        pool = compile_pool(ALL_ELEMENTS)
+        assert len(pool.weights) == 118
+        assert pool.cum_weights[-1] == sum(pool.weights)
+
+    def test_empty_curriculum_rejected(self):
+        """A curriculum matching no elements should be rejected."""
+        with pytest.raises(ValueError, match="No elements match"):
+            compile_pool(Curriculum(numbers=(1, 2), valence=[8]))
+
+    def test_invalid_filters_rejected(self):
+        """Malformed criteria should be rejected up front."""
+        with pytest.raises(ValueError):
+            Curriculum(numbers=(0, 10))
+        with pytest.raises(ValueError):
+            Curriculum(numbers=(20, 10))
+        with pytest.raises(ValueError):
+            Curriculum(discovered=(1900, 1800))
+        with pytest.raises(ValueError):
+            Curriculum(valence=[9])
+        with pytest.raises(ValueError):
+            Curriculum(elements=["Xx"])
+
+    def test_quiz_samples_from_curriculum(self):
+        """A quiz should only ask about elements in its curriculum."""
+        quiz = PeriodicQuiz(curriculum=NOBLE_GASES)
+        for _ in range(50):
+            assert quiz.get_random_element()[1] in ("He", "Ne", "Ar", "Kr", "Xe", "Rn", "Og")
@@ -0,0 +1,105 @@
+"""Unit tests for leaderboards."""
+
+import time
+import pytest
+from datetime import datetime, timedelta, timezone
+from periodic_quiz.game import RoundResult
+from periodic_quiz.leaderboard import Leaderboard, window_key
+
+MONDAY = datetime(2026, 10, 19, 9, 0)
+
+
+def result(score: int, total: int = 10, duration: float = 60.0) -> RoundResult:
+    return RoundResult(score, total, score / total * 100, duration, 0)
+
+
+class TestWindowKey:
+    """Tests for naming time windows."""
+
+    def test_keys(self):
+        """Day, week and all-time keys should name the window."""
+        assert window_key("day", MONDAY) == "2026-10-19"
+        assert window_key("week", MONDAY + timedelta(days=6)) == "2026-W43"
+        assert window_key("all", MONDAY) == "all"
+
+    def test_unknown_window(self):
+        """An unknown window should be rejected."""
+        with pytest.raises(ValueError):
+            window_key("month", MONDAY)
+
+
+class TestLeaderboard:
+    """Tests for top-k rankings."""
+
+    def setup_method(self):
+        self.board = Leaderboard(k=3, flush_every=100)
+
+    def teardown_method(self):
+        self.board.close()
+
+    def test_ranking_order(self):
+        """Higher percentage ranks first, then faster time."""
+        self.board.submit("ada", result(7), when=MONDAY)
+        self.board.submit("bo", result(9, duration=90), when=MONDAY)
+        self.board.submit("cy", result(9, duration=30), when=MONDAY)
+        assert [e.player for e in self.board.top(when=MONDAY)] == ["cy", "bo", "ada"]
+
+    def test_keeps_only_k(self):
+        """Only the top k results should be returned."""
+        for i in range(10):
+            self.board.submit(f"p{i}", result(i), when=MONDAY)
+        assert [e.player for e in self.board.top(when=MONDAY)] == ["p9", "p8", "p7"]
+
+    def test_windows(self):
+        """Day and week boards should only include their own results."""
+        self.board.submit("early", result(10), when=MONDAY)
+        self.board.submit("later", result(5), when=MONDAY + timedelta(days=1))
+        tuesday = MONDAY + timedelta(days=1)
+        assert [e.player for e in self.board.top(window="day", when=tuesday)] == ["later"]
+        assert [e.player for e in self.board.top(window="week", when=tuesday)] == ["early", "later"]
+        next_week = MONDAY + timedelta(weeks=1)
+        assert self.board.top(window="week", when=next_week) == []
+        assert [e.player for e in self.board.top(window="day", when=MONDAY)] == ["early"]
+
+    def test_timezone_aware_results(self, monkeypatch):
+        """Results stamped in UTC should land on the UTC day, whatever the local timezone."""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            when = datetime(2026, 10, 19, 2, 0, tzinfo=timezone.utc)
+            self.board.submit("ada", result(8), when=when)
+            assert [e.player for e in self.board.top(window="day", when=when)] == ["ada"]
+            self.board.flush()
+            self.board._top.clear()
+            assert [e.player for e in self.board.top(window="day", when=when)] == ["ada"]
+            assert [e.player for e in self.board.top(window="week", when=when)] == ["ada"]
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_boards_are_separate(self):
+        """Results on one board should not appear on another."""
+        self.board.submit("ada", result(8), board="class-7b", when=MONDAY)
+        self.board.submit("bo", result(6), board="class-7c", when=MONDAY)
+        assert [e.player for e in self.board.top("class-7b", when=MONDAY)] == ["ada"]
+
+    def test_write_behind(self, tmp_path):
+        """Results should reach SQLite in batches and survive reopening."""
+        path = tmp_path / "scores.db"
+        board = Leaderboard(path, k=3, flush_every=2)
+        board.submit("ada", result(8), when=MONDAY)
+        assert board._buffer
+        board.submit("bo", result(6), when=MONDAY)
+        assert not board._buffer
+        board.submit("cy", result(10), when=MONDAY)
+        board.close()
+
+        reopened = Leaderboard(path, k=3)
+        assert [e.player for e in reopened.top(when=MONDAY)] == ["cy", "ada", "bo"]
+        reopened.close()
+
+    def test_show(self, capsys):
+        """show should print the ranking."""
+        self.board.submit("ada", result(8))
+        self.board.show()
+        assert "ada" in capsys.readouterr().out
@@ -0,0 +1,90 @@
+"""Unit tests for answer normalization."""
+
+from unittest.mock import patch
+from periodic_quiz.game import PeriodicQuiz
+from periodic_quiz.normalize import normalize_answer, resolve_name, resolve_symbol
+
+CESIUM = (55, "Cs", "Cesium", 1, 1860)
+HYDROGEN = (1, "H", "Hydrogen", 1, 1766)
+NEON = (10, "Ne", "Neon", 8, 1898)
+
+
+class TestNormalizeAnswer:
+    """Tests for reducing answers to canonical form."""
+
+    def test_casefold_and_whitespace(self):
+        """Case and extra whitespace should be ignored."""
+        assert normalize_answer("  HyDrOgEn  ") == "hydrogen"
+        assert normalize_answer("hydrogen   gas") == "hydrogen gas"
+
+    def test_diacritics(self):
+        """Accents should be stripped."""
+        assert normalize_answer("Çesium") == "cesium"
+        assert normalize_answer("Tungstène") == "tungstene"
+
+    def test_fullwidth(self):
+        """Fullwidth letters and digits should become ASCII."""
+        assert normalize_answer("Ｈｙｄｒｏｇｅｎ") == "hydrogen"
+        assert normalize_answer("７９") == "79"
+
+    def test_punctuation(self):
+        """Stray punctuation should be removed."""
+        assert normalize_answer("gold.") == "gold"
+        assert normalize_answer("'Iron'!") == "iron"
+
+
+class TestResolve:
+    """Tests for exact lookups against the element table."""
+
+    def test_aliases(self):
+        """Alternate spellings should resolve to the same element."""
+        assert resolve_name("Caesium") == resolve_name("Cesium") == 55
+        assert resolve_name("aluminium") == resolve_name("Aluminum") == 13
+        assert resolve_name("Sulphur") == 16
+
+    def test_unknown(self):
+        """Misspellings should not resolve exactly."""
+        assert resolve_name("Hydorgen") is None
+
+    def test_symbol(self):
+        """Symbols should resolve regardless of case or width."""
+        assert resolve_symbol("ａｕ") == 79
+        assert resolve_symbol("X") is None
+
+
+class TestNormalizedGrading:
+    """Tests for graders using normalized answers."""
+
+    def setup_method(self):
+        self.quiz = PeriodicQuiz()
+
+    @patch('builtins.input', return_value='Çaesium')
+    def test_accented_alias(self, mock_input):
+        """An accented alternate spelling should be accepted."""
+        assert self.quiz.ask_symbol_to_name(CESIUM) is True
+
+    @patch('builtins.input', return_value='Ｈｙｄｒｏｇｅｎ')
+    def test_fullwidth_name(self, mock_input):
+        """A fullwidth name should be accepted."""
+        assert self.quiz.ask_number_to_name(HYDROGEN) is True
+
+    @patch('builtins.input', return_value='１')
+    def test_fullwidth_number(self, mock_input):
+        """A fullwidth atomic number should be accepted."""
+        assert self.quiz.ask_name_to_number(HYDROGEN) is True
+
+    @patch('builtins.input', side_effect=['1.0', '1,0', '-10'])
+    def test_punctuated_number_rejected(self, mock_input):
+        """Punctuation in a numeric answer should not be stripped into a correct number."""
+        for _ in range(3):
+            assert self.quiz.ask_name_to_number(NEON) is False
+
+    @patch('builtins.input', return_value='-1')
+    def test_negative_number_rejected(self, mock_input):
+        """A negative atomic number should be rejected."""
+        assert self.quiz.ask_name_to_number(HYDROGEN) is False
+
+    @patch('builtins.input', return_value='Xenon')
+    def test_other_element_not_close_match(self, mock_input):
+        """Naming a different element should not pass as a typo."""
+        assert self.quiz.ask_symbol_to_name(NEON) is False
@@ -0,0 +1,57 @@
+"""Unit tests for CLI profiling."""
+
+import time
+import pytest
+from periodic_quiz import main
+from periodic_quiz.profiling import StackSampler, run_profiled
+
+
+def busy(seconds: float = 0.05):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestStackSampler:
+    """Tests for the sampling tracer."""
+
+    def test_collects_stacks(self, tmp_path):
+        """Samples should be written root-first in collapsed-stack format."""
+        sampler = StackSampler(interval=0.001)
+        sampler.start()
+        busy()
+        sampler.stop()
+        assert any(stack.endswith("tests.test_profiling:busy") for stack in sampler.stacks)
+
+        path = tmp_path / "out.collapsed"
+        sampler.write_collapsed(path)
+        stack, count = path.read_text().splitlines()[0].rsplit(" ", 1)
+        assert ";" in stack and int(count) > 0
+
+
+class TestRunProfiled:
+    """Tests for profiling a session."""
+
+    def test_writes_outputs(self, tmp_path, capsys):
+        """Profiling should return the result and write both files."""
+        prefix = str(tmp_path / "session")
+        assert run_profiled(lambda: 42, prefix) == 42
+        assert (tmp_path / "session.pstats").exists()
+        assert (tmp_path / "session.collapsed").exists()
+        assert "hottest functions" in capsys.readouterr().out
+
+    def test_simulated_session_from_cli(self, tmp_path, capsys):
+        """--profile with --simulate should report the package's hot functions."""
+        prefix = str(tmp_path / "sim")
+        main(["--simulate", "5", "--profile", prefix])
+        output = capsys.readouterr().out
+        assert "SIMULATION REPORT" in output
+        assert "play_round" in output
+        assert (tmp_path / "sim.pstats").exists()
+
+    def test_simulate_rounds_must_be_positive(self, capsys):
+        """--simulate 0 should be a usage error, not a traceback."""
+        with pytest.raises(SystemExit) as excinfo:
+            main(["--simulate", "0"])
+        assert excinfo.value.code == 2
+        assert "must be at least 1" in capsys.readouterr().err
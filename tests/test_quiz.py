@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import patch
-from periodic_quiz.game import is_close_match, PeriodicQuiz
+from periodic_quiz.game import is_close_match, PeriodicQuiz, RetryStrategy, RoundState
 from periodic_quiz.elements import ELEMENTS, get_element_by_symbol
 
 
@@ -187,6 +187,84 @@ class TestPeriodicQuiz:
         assert mode == "symbol_to_name"
 
 
+class TestRetryStrategy:
+    """Tests for bounded retrying of missed questions."""
+
+    def setup_method(self):
+        self.quiz = PeriodicQuiz()
+        self.quiz.get_random_element = lambda: (1, "H", "Hydrogen", 1, 1766)
+
+    @patch('builtins.input', return_value='2')
+    def test_default_retries_until_correct(self, mock_input):
+        """Without limits, missed questions are retried until answered correctly."""
+        mock_input.side_effect = ["2", "1", "2", "2", "1"]
+        self.quiz.play_round("name_to_number", 2)
+        assert mock_input.call_count == 5
+        assert (self.quiz.score, self.quiz.total) == (2, 5)
+
+    @patch('builtins.input', return_value='2')
+    def test_max_rounds(self, mock_input):
+        """A student who never answers correctly should stop after max_rounds."""
+        self.quiz.play_round("name_to_number", 3, strategy=RetryStrategy(max_rounds=2))
+        assert mock_input.call_count == 3 + 3 + 3
+        assert self.quiz.total == 9
+
+    @patch('builtins.input', return_value='2')
+    def test_zero_rounds_skips_retries(self, mock_input, capsys):
+        """max_rounds=0 should skip retrying entirely, without announcing a retry."""
+        self.quiz.play_round("name_to_number", 4, strategy=RetryStrategy(max_rounds=0))
+        assert self.quiz.total == 4
+        output = capsys.readouterr().out
+        assert "RETRY:" not in output
+        assert "Retry limit reached: 4 question(s) left to review." in output
+
+    @patch('builtins.input', return_value='2')
+    def test_time_budget(self, mock_input):
+        """Retry rounds should stop once the time budget is spent."""
+        with patch('periodic_quiz.game.time.monotonic', side_effect=[0.0, 0.0, 1.0, 2.0, 3.0, 4.0]):
+            self.quiz.play_round("name_to_number", 2, strategy=RetryStrategy(time_budget=2.5))
+        assert self.quiz.total == 2 + 2
+
+    @patch('builtins.input', return_value='2')
+    def test_max_queue(self, mock_input):
+        """Only max_queue missed questions should be kept for retrying."""
+        self.quiz.play_round("name_to_number", 5, strategy=RetryStrategy(max_rounds=1, max_queue=2))
+        assert self.quiz.total == 5 + 2
+
+    def test_spacing_reinserts_into_main_stream(self):
+        """With spacing, a missed question comes back after spacing new questions."""
+        asked = []
+
+        def ask(mode, element=None):
+            # New questions are always missed, reviews always answered correctly.
+            asked.append("new" if element is None else "review")
+            return (element is not None, element or (1, "H", "Hydrogen", 1, 1766), mode)
+
+        self.quiz.ask_question = ask
+        self.quiz.play_round("name_to_number", 4, strategy=RetryStrategy(spacing=1))
+        assert asked == ["new", "new", "review", "new", "review", "new", "review", "review"]
+
+    def test_spacing_is_exponential(self):
+        """Each repeated miss should double the gap before the question returns."""
+        strategy = RetryStrategy(spacing=3)
+        state = RoundState("name_to_number", 100, asked=10)
+        hydrogen = (1, "H", "Hydrogen", 1, 1766)
+        strategy.requeue(state, hydrogen, "name_to_number", attempts=0)
+        strategy.requeue(state, hydrogen, "name_to_number", attempts=2)
+        assert [entry[0] for entry in sorted(state.scheduled)] == [13, 22]
+
+    def test_invalid_strategy(self):
+        """Nonsensical limits should be rejected."""
+        with pytest.raises(ValueError):
+            RetryStrategy(max_rounds=-1)
+        with pytest.raises(ValueError):
+            RetryStrategy(time_budget=0)
+        with pytest.raises(ValueError):
+            RetryStrategy(spacing=-1)
+        with pytest.raises(ValueError):
+            RetryStrategy(max_queue=0)
+
+
 class TestNameToSymbol:
     """Tests for name to symbol quiz mode."""
 
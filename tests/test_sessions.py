@@ -0,0 +1,115 @@
+"""Unit tests for the session manager."""
+
+import pytest
+from unittest.mock import patch
+from periodic_quiz.curriculum import FIRST_20, Curriculum
+from periodic_quiz.game import PeriodicQuiz
+from periodic_quiz.sessions import Session, SessionManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSession:
+    """Tests for per-session state."""
+
+    def test_spill_round_trip(self):
+        """A session should survive being written out and read back."""
+        session = Session("ada", FIRST_20, score=3, total=5)
+        with patch('builtins.input', side_effect=["1", EOFError]):
+            quiz = PeriodicQuiz(curriculum=FIRST_20)
+            quiz.get_random_element = lambda: (1, "H", "Hydrogen", 1, 1766)
+            with pytest.raises(EOFError):
+                quiz.play_round("name_to_number", 4, checkpoint=session)
+
+        restored = Session.from_bytes("ada", session.to_bytes())
+        assert restored.curriculum == FIRST_20
+        assert (restored.score, restored.total) == (3, 5)
+        assert restored.load()[0] == session.load()[0]
+
+    def test_shares_pool(self):
+        """Quizzes for sessions with the same curriculum should share the element table."""
+        assert PeriodicQuiz(curriculum=FIRST_20).elements is PeriodicQuiz(curriculum=FIRST_20).elements
+
+
+class TestSessionManager:
+    """Tests for eviction and reloading."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+
+    def test_lru_eviction_and_reload(self, tmp_path):
+        """Sessions over the limit should spill to disk and reload on demand."""
+        manager = SessionManager(tmp_path, max_sessions=2, clock=self.clock)
+        manager.session("a", FIRST_20).score = 7
+        manager.session("b")
+        manager.session("c")
+        assert len(manager) == 2
+        assert (tmp_path / "a.session").exists()
+
+        session = manager.session("a")
+        assert session.score == 7
+        assert session.curriculum == FIRST_20
+        assert not (tmp_path / "a.session").exists()
+        assert (tmp_path / "b.session").exists()
+
+    def test_ttl_eviction(self, tmp_path):
+        """Idle sessions should be spilled once their TTL passes."""
+        manager = SessionManager(tmp_path, ttl=60, clock=self.clock)
+        manager.session("a")
+        self.clock.now = 30
+        manager.session("b")
+        self.clock.now = 61
+        assert manager.evict() == 1
+        assert len(manager) == 1
+
+    @patch('builtins.input', return_value='1')
+    def test_resume_after_spill(self, mock_input, tmp_path):
+        """An interrupted round should resume after its session was spilled."""
+        manager = SessionManager(tmp_path, max_sessions=1, clock=self.clock)
+        hydrogen_only = Curriculum(elements=["H"])
+        manager.session("ada", hydrogen_only)
+        mock_input.side_effect = ["1", "2", EOFError]
+        with pytest.raises(EOFError):
+            manager.play_round("ada", "name_to_number", 3)
+
+        manager.session("bo")
+        assert (tmp_path / "ada.session").exists()
+
+        mock_input.side_effect = ["1", "1"]
+        result = manager.play_round("ada", "name_to_number", 3)
+        assert (result.score, result.total) == (3, 4)
+        assert manager.session("ada").load() is None
+
+    @patch('builtins.input', return_value='2')
+    def test_retries_bounded_by_default(self, mock_input, tmp_path):
+        """A student who never answers correctly should not keep a managed session retrying."""
+        manager = SessionManager(tmp_path, clock=self.clock)
+        manager.session("bot", Curriculum(elements=["H"]))
+        result = manager.play_round("bot", "name_to_number", 2)
+        assert result.retry_rounds == SessionManager.DEFAULT_STRATEGY.max_rounds
+        assert result.total == 2 * (1 + SessionManager.DEFAULT_STRATEGY.max_rounds)
+
+    def test_invalid_ids_and_curricula(self, tmp_path):
+        """Unsafe session ids and empty curricula should be rejected."""
+        manager = SessionManager(tmp_path)
+        with pytest.raises(ValueError):
+            manager.session("../etc/passwd")
+        with pytest.raises(ValueError):
+            manager.session("abc\n")
+        with pytest.raises(ValueError):
+            manager.session("x", Curriculum(numbers=(1, 2), valence=[8]))
+
+    def test_memory_report(self, tmp_path):
+        """Idle sessions should cost a small, fixed amount of memory."""
+        manager = SessionManager(tmp_path, clock=self.clock)
+        for i in range(100):
+            manager.session(f"s{i}")
+        report = manager.memory_report()
+        assert report["sessions"] == 100
+        assert report["bytes_per_session"] < 200
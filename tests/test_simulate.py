@@ -0,0 +1,94 @@
+"""Unit tests for the simulated-player load harness."""
+
+import random
+import pytest
+from periodic_quiz.game import PeriodicQuiz, is_close_match
+from periodic_quiz.simulate import SimulatedPlayer, correct_answer, main, make_typo, simulate
+
+GOLD = (79, "Au", "Gold", 1, "ancient")
+
+
+class TestMakeTypo:
+    """Tests for the boundary-seeking typo generator."""
+
+    def test_lands_on_both_sides_of_threshold(self):
+        """Typos of a long name should sometimes pass and sometimes fail is_close_match."""
+        rng = random.Random(1)
+        results = {is_close_match(make_typo("Praseodymium", rng), "Praseodymium") for _ in range(200)}
+        assert results == {True, False}
+
+    def test_changes_word(self):
+        """Typos should almost never reproduce the correct spelling."""
+        rng = random.Random(2)
+        typos = [make_typo("Hydrogen", rng) for _ in range(200)]
+        assert sum(typo == "Hydrogen" for typo in typos) < 10
+
+
+class TestSimulatedPlayer:
+    """Tests for the synthetic student."""
+
+    def test_perfect_player(self):
+        """A player with full accuracy and no typos should always answer correctly."""
+        player = SimulatedPlayer(accuracy=1.0, typo_rate=0.0, seed=3)
+        for mode in ("name_to_symbol", "symbol_to_name", "name_to_number", "number_to_name"):
+            assert player(mode, GOLD) == correct_answer(mode, GOLD)
+
+    def test_latency_advances_clock(self):
+        """Each answer should move the simulated clock forward."""
+        player = SimulatedPlayer(seed=4)
+        player("name_to_symbol", GOLD)
+        assert player.clock() > 0
+
+    def test_drives_quiz_without_input(self):
+        """A responder should replace input() entirely."""
+        quiz = PeriodicQuiz(responder=SimulatedPlayer(accuracy=1.0, typo_rate=0.0, seed=5))
+        result = quiz.play_round("random", 5)
+        assert (result.score, result.total, result.retry_rounds) == (5, 5, 0)
+
+    def test_invalid_accuracy(self):
+        """Accuracy outside 0-1 should be rejected."""
+        with pytest.raises(ValueError):
+            SimulatedPlayer(accuracy=1.5)
+
+
+class TestSimulate:
+    """Tests for the simulation runner."""
+
+    def test_in_process_report(self):
+        """Running in-process should report throughput and retry depths."""
+        report = simulate(rounds=20, workers=1, num_questions=5, accuracy=0.0, max_rounds=2)
+        assert report["questions"] == 20 * 15
+        assert report["retry_depths"] == {2: 20}
+        assert report["cpu_per_question"] > 0
+        assert report["latency"].count == 20 * 15
+
+    def test_global_random_state_restored(self):
+        """Running in-process should not reseed the caller's random module."""
+        random.seed(1234)
+        expected = random.Random(1234).random()
+        simulate(rounds=2, workers=1, num_questions=3)
+        assert random.random() == expected
+
+    def test_invalid_num_questions(self):
+        """A round needs at least one question."""
+        with pytest.raises(ValueError):
+            simulate(rounds=1, workers=1, num_questions=0)
+
+    def test_unknown_mode_rejected_by_simulate(self):
+        """simulate() itself should reject an unknown mode instead of reporting bogus numbers."""
+        with pytest.raises(ValueError, match="Unknown mode"):
+            simulate(rounds=3, workers=1, mode="bogus")
+
+    def test_unknown_mode_rejected(self):
+        """The command line should only accept known quiz modes."""
+        with pytest.raises(SystemExit):
+            main(["--mode", "bogus", "--workers", "1"])
+
+    @pytest.mark.parametrize("argv", [["--rounds", "0"], ["--workers", "-1"], ["--questions", "0"],
+                                      ["--max-rounds", "-1"]])
+    def test_bad_numbers_are_usage_errors(self, argv, capsys):
+        """Out-of-range numbers should give a usage error, not a traceback."""
+        with pytest.raises(SystemExit) as excinfo:
+            main(argv)
+        assert excinfo.value.code == 2
+        assert "must be at least" in capsys.readouterr().err
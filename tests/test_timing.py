@@ -0,0 +1,114 @@
+"""Unit tests for timed quizzes."""
+
+import pytest
+from unittest.mock import patch
+from periodic_quiz.game import PeriodicQuiz
+from periodic_quiz.timing import LatencyHistogram, TimedMode
+
+HYDROGEN = (1, "H", "Hydrogen", 1, 1766)
+GOLD = (79, "Au", "Gold", 1, "ancient")
+
+
+class FakeClock:
+    """Clock that advances by a fixed step every time it is read."""
+
+    def __init__(self, step: float):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+class TestLatencyHistogram:
+    """Tests for the streaming latency histogram."""
+
+    def test_empty(self):
+        """An empty histogram should report zeros."""
+        histogram = LatencyHistogram()
+        assert histogram.mean() == 0.0
+        assert histogram.percentile(50) == 0.0
+
+    def test_percentiles_within_bucket_error(self):
+        """Percentiles should be within one bucket width of the true value."""
+        histogram = LatencyHistogram()
+        for i in range(1, 1001):
+            histogram.record(i / 100)  # 0.01s to 10s
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(5.0, rel=0.1)
+        assert histogram.percentile(90) == pytest.approx(9.0, rel=0.1)
+        assert histogram.percentile(100) == 10.0
+        assert histogram.mean() == pytest.approx(5.005)
+
+    def test_memory_is_bounded(self):
+        """Recording many samples should not grow the bucket array."""
+        histogram = LatencyHistogram()
+        for i in range(10000):
+            histogram.record(i * 0.37)
+        assert len(histogram.counts) == LatencyHistogram.NUM_BUCKETS
+
+    def test_invalid_percentile(self):
+        """Percentiles outside 0-100 should be rejected."""
+        with pytest.raises(ValueError):
+            LatencyHistogram().percentile(101)
+
+
+class TestTimedMode:
+    """Tests for timed quiz settings and measurements."""
+
+    def test_per_element_tracking(self):
+        """Latencies should be tracked per element and for the round."""
+        timed = TimedMode()
+        timed.record(HYDROGEN, 1.0)
+        timed.record(GOLD, 4.0)
+        timed.record(GOLD, 6.0)
+        assert timed.round.count == 3
+        assert timed.slowest_elements(1) == [(79, pytest.approx(4.0, rel=0.1))]
+
+    def test_invalid_settings(self):
+        """Non-positive limits should be rejected."""
+        with pytest.raises(ValueError):
+            TimedMode(deadline=0)
+        with pytest.raises(ValueError):
+            TimedMode(round_time=-1)
+
+
+class TestTimedQuiz:
+    """Tests for PeriodicQuiz in timed mode."""
+
+    @patch('builtins.input', return_value='H')
+    def test_latency_recorded(self, mock_input):
+        """Every ask_* call should record a latency."""
+        quiz = PeriodicQuiz(timed=TimedMode(clock=FakeClock(0.5)))
+        assert quiz.ask_name_to_symbol(HYDROGEN) is True
+        assert quiz.timed.by_element[1].count == 1
+        assert quiz.timed.by_element[1].max == pytest.approx(0.5)
+
+    @patch('builtins.input', return_value='H')
+    def test_deadline_missed(self, mock_input, capsys):
+        """A correct answer after the deadline should count as wrong, with a single verdict."""
+        quiz = PeriodicQuiz(timed=TimedMode(deadline=1.0, clock=FakeClock(2.0)))
+        assert quiz.ask_name_to_symbol(HYDROGEN) is False
+        output = capsys.readouterr().out
+        assert "Too slow!" in output
+        assert "Correct!" not in output
+
+    @patch('builtins.input', return_value='1')
+    def test_round_time(self, mock_input):
+        """A time-boxed round should stop asking once time runs out."""
+        quiz = PeriodicQuiz(timed=TimedMode(round_time=5.0, clock=FakeClock(1.0)))
+        quiz.get_random_element = lambda: HYDROGEN
+        quiz.play_round("name_to_number", 100)
+        # Each question reads the clock three times: round check, start, end.
+        assert quiz.total == 2
+
+    @patch('builtins.input', return_value='1')
+    def test_final_score_reports_speed(self, mock_input, capsys):
+        """The final score should include response times in timed mode."""
+        quiz = PeriodicQuiz(timed=TimedMode(clock=FakeClock(1.0)))
+        quiz.get_random_element = lambda: HYDROGEN
+        quiz.play_round("name_to_number", 3)
+        output = capsys.readouterr().out
+        assert "Speed: 3 answers" in output
+        assert "Slowest elements: Hydrogen" in output